@@ -16,8 +16,16 @@
 # under the License.
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
-from typing import TYPE_CHECKING
+import json
+import re
+import threading
+import time
+from collections.abc import Sequence
+from functools import cached_property
+from typing import TYPE_CHECKING, cast
+
+from botocore.exceptions import ClientError
+from sqlalchemy.pool import QueuePool
 
 from airflow.exceptions import AirflowException
 from airflow.models import BaseOperator
@@ -27,9 +35,76 @@ from airflow.providers.amazon.aws.hooks.s3 import S3Hook
 from airflow.providers.amazon.aws.utils.redshift import build_credentials_block
 
 if TYPE_CHECKING:
+    from airflow.models.connection import Connection
     from airflow.utils.context import Context
 
-AVAILABLE_METHODS = ["APPEND", "REPLACE", "UPSERT"]
+AVAILABLE_METHODS = frozenset({"APPEND", "REPLACE", "UPSERT", "EXTERNAL"})
+
+# Names of the operator methods building the SQL of each COPY based load method.
+_METHOD_BUILDERS = {
+    "APPEND": "_build_append_sql",
+    "REPLACE": "_build_replace_sql",
+    "UPSERT": "_build_upsert_sql",
+}
+
+# A COPY option is a keyword, e.g. ``CSV`` or ``BZIP2``, optionally followed by its arguments.
+_COPY_OPTION_PATTERN = re.compile(r"^[A-Z][A-Z0-9_]*(\s+\S.*)?$", re.IGNORECASE | re.DOTALL)
+
+_COPY_TEMPLATE = (
+    "COPY {destination} {column_names} FROM 's3://{bucket}/{key}' "
+    "{authorization} {region_info} {copy_options};"
+)
+
+_REDSHIFT_POOLS: dict[str, QueuePool] = {}
+
+# Primary keys looked up for UPSERT, keyed by connection and table, stored with the lookup time.
+_PRIMARY_KEY_CACHE: dict[tuple[str, ...], tuple[float, list[str]]] = {}
+_PRIMARY_KEY_CACHE_TTL = 3600
+_PRIMARY_KEY_CACHE_MAXSIZE = 512
+
+# AWS connections read by the operator, keyed by connection id, stored with the lookup time.
+_CONN_CACHE: dict[str, tuple[float, Connection]] = {}
+_CONN_TTL = 300
+
+# Regions of the S3 buckets loaded from, keyed by bucket name.
+_BUCKET_REGION_CACHE: dict[str, str] = {}
+
+# Seconds to wait for the destination table facets fetched in the background during execute().
+_FACETS_PREFETCH_TIMEOUT = 10
+
+
+def _get_aws_connection(conn_id: str) -> Connection:
+    """Return the AWS connection, reusing a recently fetched one to avoid hitting secrets backends."""
+    cached = _CONN_CACHE.get(conn_id)
+    if cached and time.monotonic() - cached[0] < _CONN_TTL:
+        return cached[1]
+    conn = S3Hook.get_connection(conn_id=conn_id)
+    _CONN_CACHE[conn_id] = (time.monotonic(), conn)
+    return conn
+
+
+def _is_openlineage_enabled() -> bool:
+    """Check whether the OpenLineage provider is installed and enabled."""
+    try:
+        from airflow.providers.openlineage.conf import is_disabled
+    except ImportError:
+        return False
+    return not is_disabled()
+
+
+class _PooledRedshiftSQLHook(RedshiftSQLHook):
+    """RedshiftSQLHook lending connections from a process-wide pool keyed by ``redshift_conn_id``."""
+
+    def get_conn(self):
+        conn_id = self.get_conn_id()
+        pool = _REDSHIFT_POOLS.get(conn_id)
+        if pool is None:
+            pool = _REDSHIFT_POOLS[conn_id] = QueuePool(super().get_conn, pool_size=2, max_overflow=4)
+        # Closing the returned proxy releases the connection back to the pool.
+        return pool.connect()
+
+    def set_autocommit(self, conn, autocommit):
+        conn.dbapi_connection.autocommit = autocommit
 
 
 class S3ToRedshiftOperator(BaseOperator):
@@ -42,7 +117,8 @@ class S3ToRedshiftOperator(BaseOperator):
 
     :param table: reference to a specific table in redshift database
     :param s3_bucket: reference to a specific S3 bucket
-    :param s3_key: key prefix that selects single or multiple objects from S3
+    :param s3_key: key prefix that selects single or multiple objects from S3.
+        When ``manifest_keys`` is provided, the key the generated manifest file is written to
     :param schema: reference to a specific schema in redshift database.
         Do not provide when copying into a temporary table
     :param redshift_conn_id: reference to a specific redshift database OR a redshift data-api connection
@@ -50,6 +126,11 @@ class S3ToRedshiftOperator(BaseOperator):
         If the AWS connection contains 'aws_iam_role' in ``extras``
         the operator will use AWS STS credentials with a token
         https://docs.aws.amazon.com/redshift/latest/dg/copy-parameters-authorization.html#copy-credentials
+    :param prefer_iam_role_default: Whether to authorize the COPY with ``IAM_ROLE default``,
+        i.e. the default IAM role associated with the Redshift cluster, instead of
+        passing temporary credentials from ``aws_conn_id``. Ignored if the AWS connection
+        contains ``role_arn`` in ``extras``. Defaults to False.
+        https://docs.aws.amazon.com/redshift/latest/dg/copy-parameters-authorization.html#copy-iam-role
     :param verify: Whether to verify SSL certificates for S3 connection.
         By default, SSL certificates are verified.
         You can provide the following values:
@@ -60,14 +141,48 @@ class S3ToRedshiftOperator(BaseOperator):
         - ``path/to/cert/bundle.pem``: A filename of the CA cert bundle to uses.
                  You can specify this argument if you want to use a different
                  CA cert bundle than the one used by botocore.
+    :param detect_bucket_region: Whether to look up the region of ``s3_bucket`` and pass it to the COPY
+        when the AWS connection doesn't set ``region`` in ``extras``, so buckets outside the cluster's
+        region can be loaded. Requires the ``s3:GetBucketLocation`` permission. Defaults to False.
     :param column_list: list of column names to load source data fields into specific target columns
         https://docs.aws.amazon.com/redshift/latest/dg/copy-parameters-column-mapping.html#copy-column-list
     :param copy_options: reference to a list of COPY options
-    :param method: Action to be performed on execution. Available ``APPEND``, ``UPSERT`` and ``REPLACE``.
+    :param method: Action to be performed on execution. Available ``APPEND``, ``UPSERT``, ``REPLACE``
+        and ``EXTERNAL``. ``EXTERNAL`` doesn't load any data but creates a Redshift Spectrum external
+        table over the ``s3_key`` prefix, in which case ``schema`` must be an external schema.
+        An existing external table with the same name is dropped first, so that retries succeed.
+        https://docs.aws.amazon.com/redshift/latest/dg/r_CREATE_EXTERNAL_TABLE.html
     :param upsert_keys: List of fields to use as key on upsert action
+    :param columns_ddl: Column definitions of the external table, e.g. ``"id INT, name VARCHAR(64)"``.
+        Required for the ``EXTERNAL`` method.
+    :param external_table_format: Row format and file format clauses of the external table.
+        Only used by the ``EXTERNAL`` method. Defaults to ``STORED AS PARQUET``.
+    :param upsert_staging_distkey: Whether to distribute and sort the UPSERT staging table on the first
+        upsert key instead of inheriting the distribution and sort keys of the destination. Redshift
+        doesn't allow distribution or sort keys with ``CREATE TABLE ... LIKE``, so the staging table is
+        then created with ``CREATE TABLE ... AS`` and doesn't inherit column defaults from the
+        destination. Defaults to False.
     :param redshift_data_api_kwargs: If using the Redshift Data API instead of the SQL-based connection,
         dict of arguments for the hook's ``execute_query`` method.
         Cannot include any of these kwargs: ``{'sql', 'parameters'}``
+    :param disable_compupdate: Whether to append ``COMPUPDATE OFF`` and ``STATUPDATE OFF`` to
+        ``copy_options`` when they are not already specified, skipping automatic compression analysis
+        and statistics refresh on every load. Nothing is appended if any option is a Jinja template,
+        as it may set them once rendered. Defaults to False.
+        https://docs.aws.amazon.com/redshift/latest/dg/copy-parameters-data-load.html
+    :param manifest_keys: list of keys in ``s3_bucket`` to load with a single COPY command.
+        If provided, a manifest file listing them is written to ``s3_key`` and the COPY
+        is run with the ``MANIFEST`` option. An empty list fails the task, or skips the load
+        if ``skip_if_empty`` is set.
+        https://docs.aws.amazon.com/redshift/latest/dg/loading-data-files-using-manifest.html
+    :param use_connection_pool: Whether to reuse Redshift SQL connections across task runs in the
+        same process instead of opening a new one for each run. Not used with the Redshift Data API.
+        Only enable it with executors that run several tasks in one long-lived process. Defaults to False.
+    :param skip_if_empty: Whether to skip the load, including the ``DELETE`` of the ``REPLACE`` method,
+        when no objects match the ``s3_key`` prefix, or ``manifest_keys`` is an empty list, instead of
+        failing. Defaults to False.
+    :param emit_openlineage: Whether to emit OpenLineage metadata for this task. When False, the
+        destination table schema is not queried after the load. Defaults to True.
     """
 
     template_fields: Sequence[str] = (
@@ -81,6 +196,8 @@ class S3ToRedshiftOperator(BaseOperator):
         "method",
         "redshift_data_api_kwargs",
         "aws_conn_id",
+        "manifest_keys",
+        "columns_ddl",
     )
     template_ext: Sequence[str] = ()
     ui_color = "#99e699"
@@ -95,12 +212,22 @@ class S3ToRedshiftOperator(BaseOperator):
         redshift_conn_id: str = "redshift_default",
         aws_conn_id: str | None = "aws_default",
         verify: bool | str | None = None,
+        prefer_iam_role_default: bool = False,
+        detect_bucket_region: bool = False,
         column_list: list[str] | None = None,
         copy_options: list | None = None,
         autocommit: bool = False,
         method: str = "APPEND",
         upsert_keys: list[str] | None = None,
+        upsert_staging_distkey: bool = False,
+        columns_ddl: str | None = None,
+        external_table_format: str = "STORED AS PARQUET",
         redshift_data_api_kwargs: dict | None = None,
+        disable_compupdate: bool = False,
+        manifest_keys: list[str] | None = None,
+        use_connection_pool: bool = False,
+        skip_if_empty: bool = False,
+        emit_openlineage: bool = True,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -111,12 +238,43 @@ class S3ToRedshiftOperator(BaseOperator):
         self.redshift_conn_id = redshift_conn_id
         self.aws_conn_id = aws_conn_id
         self.verify = verify
+        self.prefer_iam_role_default = prefer_iam_role_default
+        self.detect_bucket_region = detect_bucket_region
         self.column_list = column_list
         self.copy_options = copy_options or []
         self.autocommit = autocommit
         self.method = method
         self.upsert_keys = upsert_keys
+        self.upsert_staging_distkey = upsert_staging_distkey
+        self.columns_ddl = columns_ddl
+        self.external_table_format = external_table_format
         self.redshift_data_api_kwargs = redshift_data_api_kwargs or {}
+        self.disable_compupdate = disable_compupdate
+        self.manifest_keys = manifest_keys
+        self.use_connection_pool = use_connection_pool
+        self.skip_if_empty = skip_if_empty
+        self.emit_openlineage = emit_openlineage
+        self._prefetched_facets: dict | None = None
+        self._facets_thread: threading.Thread | None = None
+
+        # ``copy_options`` may also be a Jinja template rendering to the whole list.
+        if isinstance(self.copy_options, list):
+            # Options holding Jinja templates are only known once rendered.
+            has_templates = False
+            for option in self.copy_options:
+                option_sql = str(option).strip()
+                if any(marker in option_sql for marker in ("{{", "{%", "{#")):
+                    has_templates = True
+                elif option_sql and not _COPY_OPTION_PATTERN.match(option_sql):
+                    raise AirflowException(f"Invalid COPY option: {option!r}")
+
+            if self.disable_compupdate and not has_templates:
+                specified_options = " ".join(str(option) for option in self.copy_options).upper()
+                self.copy_options = self.copy_options + [
+                    f"{option} OFF"
+                    for option in ("COMPUPDATE", "STATUPDATE")
+                    if option not in specified_options
+                ]
 
         if self.redshift_data_api_kwargs:
             for arg in ["sql", "parameters"]:
@@ -127,88 +285,344 @@ class S3ToRedshiftOperator(BaseOperator):
     def use_redshift_data(self):
         return bool(self.redshift_data_api_kwargs)
 
-    def _build_copy_query(
-        self, copy_destination: str, credentials_block: str, region_info: str, copy_options: str
-    ) -> str:
-        column_names = "(" + ", ".join(self.column_list) + ")" if self.column_list else ""
-        return f"""
-                    COPY {copy_destination} {column_names}
-                    FROM 's3://{self.s3_bucket}/{self.s3_key}'
-                    credentials
-                    '{credentials_block}'
-                    {region_info}
-                    {copy_options};
-        """
+    @cached_property
+    def _redshift_data_hook(self) -> RedshiftDataHook:
+        return RedshiftDataHook(aws_conn_id=self.redshift_conn_id)
 
-    def execute(self, context: Context) -> None:
-        if self.method not in AVAILABLE_METHODS:
-            raise AirflowException(f"Method not found! Available methods: {AVAILABLE_METHODS}")
+    @cached_property
+    def _redshift_sql_hook(self) -> RedshiftSQLHook:
+        hook_class = _PooledRedshiftSQLHook if self.use_connection_pool else RedshiftSQLHook
+        return hook_class(redshift_conn_id=self.redshift_conn_id)
+
+    @cached_property
+    def _s3_hook(self) -> S3Hook:
+        return S3Hook(aws_conn_id=self.aws_conn_id, verify=self.verify)
+
+    @cached_property
+    def _aws_conn(self) -> Connection | None:
+        if self.aws_conn_id:
+            return _get_aws_connection(self.aws_conn_id)
+        return None
+
+    def _upload_manifest(self) -> None:
+        """Write a COPY manifest listing ``manifest_keys`` to ``s3_key``."""
+        manifest = {
+            "entries": [
+                {"url": f"s3://{self.s3_bucket}/{key}", "mandatory": True} for key in self.manifest_keys or []
+            ]
+        }
+        self.log.info(
+            "Uploading manifest for %s keys to s3://%s/%s",
+            len(manifest["entries"]),
+            self.s3_bucket,
+            self.s3_key,
+        )
+        self._s3_hook.load_string(
+            string_data=json.dumps(manifest),
+            key=self.s3_key,
+            bucket_name=self.s3_bucket,
+            replace=True,
+        )
+
+    def _has_source_objects(self) -> bool:
+        if self.manifest_keys is not None:
+            return bool(self.manifest_keys)
+        return bool(self._s3_hook.list_keys(bucket_name=self.s3_bucket, prefix=self.s3_key, max_items=1))
+
+    def _get_table_primary_key(self) -> list[str] | None:
+        cache_key = (
+            self.redshift_conn_id,
+            json.dumps(self.redshift_data_api_kwargs, sort_keys=True, default=str),
+            str(self.schema),
+            self.table,
+        )
+        cached = _PRIMARY_KEY_CACHE.get(cache_key)
+        if cached and time.monotonic() - cached[0] < _PRIMARY_KEY_CACHE_TTL:
+            return cached[1]
 
         if self.use_redshift_data:
-            redshift_data_hook = RedshiftDataHook(aws_conn_id=self.redshift_conn_id)
+            keys = self._redshift_data_hook.get_table_primary_key(
+                table=self.table, schema=self.schema, **self.redshift_data_api_kwargs
+            )
         else:
-            redshift_sql_hook = RedshiftSQLHook(redshift_conn_id=self.redshift_conn_id)
+            keys = self._redshift_sql_hook.get_table_primary_key(self.table, self.schema)
+
+        # Tables without a primary key are not cached so that a newly added key is picked up.
+        if keys:
+            _PRIMARY_KEY_CACHE.pop(cache_key, None)
+            if len(_PRIMARY_KEY_CACHE) >= _PRIMARY_KEY_CACHE_MAXSIZE:
+                _PRIMARY_KEY_CACHE.pop(next(iter(_PRIMARY_KEY_CACHE)))
+            _PRIMARY_KEY_CACHE[cache_key] = (time.monotonic(), keys)
+        return keys
 
-        conn = S3Hook.get_connection(conn_id=self.aws_conn_id) if self.aws_conn_id else None
+    def _get_bucket_region(self) -> str | None:
+        if self.s3_bucket not in _BUCKET_REGION_CACHE:
+            try:
+                response = self._s3_hook.get_conn().get_bucket_location(Bucket=self.s3_bucket)
+            except ClientError as e:
+                self.log.warning("Unable to get the region of bucket %s: %s", self.s3_bucket, e)
+                return None
+            # Buckets in us-east-1 have no location constraint, "EU" is the legacy name of eu-west-1.
+            location = response.get("LocationConstraint") or "us-east-1"
+            _BUCKET_REGION_CACHE[self.s3_bucket] = "eu-west-1" if location == "EU" else location
+        return _BUCKET_REGION_CACHE[self.s3_bucket]
+
+    def _get_credentials_block_and_region(self) -> tuple[str | None, str]:
+        conn = self._aws_conn
         region_info = ""
         if conn and conn.extra_dejson.get("region", False):
             region_info = f"region '{conn.extra_dejson['region']}'"
+        elif self.detect_bucket_region:
+            bucket_region = self._get_bucket_region()
+            if bucket_region:
+                region_info = f"region '{bucket_region}'"
         if conn and conn.extra_dejson.get("role_arn", False):
             credentials_block = f"aws_iam_role={conn.extra_dejson['role_arn']}"
+        elif self.prefer_iam_role_default:
+            # Redshift uses the cluster's default IAM role, no credentials are needed here.
+            credentials_block = None
         else:
-            s3_hook = S3Hook(aws_conn_id=self.aws_conn_id, verify=self.verify)
-            credentials = s3_hook.get_credentials()
+            credentials = self._s3_hook.get_credentials()
             credentials_block = build_credentials_block(credentials)
+        return credentials_block, region_info
 
-        copy_options = "\n\t\t\t".join(self.copy_options)
-        destination = f"{self.schema}.{self.table}" if self.schema else self.table
-        copy_destination = f"#{self.table}" if self.method == "UPSERT" else destination
+    def _get_output_dataset_facets(self) -> dict:
+        from airflow.providers.amazon.aws.utils.openlineage import get_facets_from_redshift_table
 
-        copy_statement = self._build_copy_query(
-            copy_destination, credentials_block, region_info, copy_options
+        if self.use_redshift_data:
+            return get_facets_from_redshift_table(
+                self._redshift_data_hook, self.table, self.redshift_data_api_kwargs, self.schema
+            )
+        return get_facets_from_redshift_table(self._redshift_sql_hook, self.table, {}, self.schema)
+
+    def _prefetch_output_dataset_facets(self) -> None:
+        """Fetch the destination table facets in a background thread while the COPY is running."""
+        # Resolve the hook in this thread so it is not created concurrently with execute().
+        _ = self._redshift_data_hook if self.use_redshift_data else self._redshift_sql_hook
+
+        def prefetch() -> None:
+            try:
+                self._prefetched_facets = self._get_output_dataset_facets()
+            except Exception:
+                self.log.debug("Failed to prefetch OpenLineage facets for %s", self.table, exc_info=True)
+
+        self._facets_thread = threading.Thread(target=prefetch, daemon=True)
+        self._facets_thread.start()
+
+    def _build_copy_query(
+        self, copy_destination: str, credentials_block: str | None, region_info: str, copy_options: str
+    ) -> str:
+        column_names = "(" + ", ".join(self.column_list) + ")" if self.column_list else ""
+        authorization = f"credentials '{credentials_block}'" if credentials_block else "IAM_ROLE default"
+        return _COPY_TEMPLATE.format_map(
+            {
+                "destination": copy_destination,
+                "column_names": column_names,
+                "bucket": self.s3_bucket,
+                "key": self.s3_key,
+                "authorization": authorization,
+                "region_info": region_info,
+                "copy_options": copy_options,
+            }
         )
 
-        sql: str | Iterable[str]
+    def _build_external_table_query(self, destination: str) -> str:
+        return (
+            f"CREATE EXTERNAL TABLE {destination} ({self.columns_ddl}) {self.external_table_format} "
+            f"LOCATION 's3://{self.s3_bucket}/{self.s3_key}';"
+        )
 
-        if self.method == "REPLACE":
-            sql = ["BEGIN;", f"DELETE FROM {destination};", copy_statement, "COMMIT"]
-        elif self.method == "UPSERT":
+    def _validate_external_table(self) -> None:
+        if not self.columns_ddl:
+            raise AirflowException("Please provide 'columns_ddl' to create an external table")
+        if not self.schema:
+            raise AirflowException("Please provide the external 'schema' to create an external table")
+        if self.manifest_keys is not None:
+            raise AirflowException("'manifest_keys' cannot be used with the 'EXTERNAL' method")
+
+    def _create_external_table(self) -> None:
+        destination = f"{self.schema}.{self.table}"
+        # External table DDL cannot run inside a transaction block, so each statement runs on its own.
+        sql = [f"DROP TABLE IF EXISTS {destination};", self._build_external_table_query(destination)]
+
+        self.log.info("Creating external table %s...", destination)
+        for statement in sql:
             if self.use_redshift_data:
-                keys = self.upsert_keys or redshift_data_hook.get_table_primary_key(
-                    table=self.table, schema=self.schema, **self.redshift_data_api_kwargs
-                )
+                self._redshift_data_hook.execute_query(sql=statement, **self.redshift_data_api_kwargs)
+            else:
+                self._redshift_sql_hook.run(statement, autocommit=True)
+        self.log.info("External table %s created...", destination)
+
+    def _build_append_sql(
+        self, copy_statement: str, destination: str, copy_destination: str, keys: list[str] | None
+    ) -> str | list[str]:
+        return copy_statement
+
+    def _build_replace_sql(
+        self, copy_statement: str, destination: str, copy_destination: str, keys: list[str] | None
+    ) -> str | list[str]:
+        return ["BEGIN;", f"DELETE FROM {destination};", copy_statement, "COMMIT;"]
+
+    def _build_upsert_sql(
+        self, copy_statement: str, destination: str, copy_destination: str, keys: list[str] | None
+    ) -> str | list[str]:
+        if not keys:
+            raise AirflowException("Upsert keys are required to build the UPSERT statement")
+        table = self.table
+        where_statement = " AND ".join(f"{table}.{k} = {copy_destination}.{k}" for k in keys)
+
+        if self.upsert_staging_distkey:
+            create_staging_table = (
+                f"CREATE TEMP TABLE {copy_destination} DISTKEY ({keys[0]}) SORTKEY ({keys[0]}) "
+                f"AS SELECT * FROM {destination} WHERE FALSE;"
+            )
+        else:
+            create_staging_table = f"CREATE TABLE {copy_destination} (LIKE {destination} INCLUDING DEFAULTS);"
+
+        return [
+            create_staging_table,
+            copy_statement,
+            "BEGIN;",
+            f"DELETE FROM {destination} USING {copy_destination} WHERE {where_statement};",
+            f"INSERT INTO {destination} SELECT * FROM {copy_destination};",
+            "COMMIT;",
+        ]
+
+    @classmethod
+    def batch_load(
+        cls, operators: Sequence[S3ToRedshiftOperator], manifest_key: str, context: Context
+    ) -> None:
+        """
+        Load the files of several operators into their common table with a single COPY.
+
+        The objects selected by each operator (its ``manifest_keys``, or the keys under its ``s3_key``
+        prefix) are listed in one manifest written to ``manifest_key`` in the operators' bucket, which
+        is then loaded with the settings of the first operator, e.g. into one staging table for ``UPSERT``.
+
+        :param operators: operators to batch, using the same table, bucket, connections and COPY settings
+        :param manifest_key: S3 key to write the combined manifest file to
+        :param context: the context of the running task, used to render the operators' templated fields
+        """
+        if not operators:
+            raise AirflowException("At least one operator is required for a batch load")
+
+        operators = [cast("S3ToRedshiftOperator", operator.prepare_for_execution()) for operator in operators]
+        for operator in operators:
+            operator.render_template_fields(context)
+
+        first = operators[0]
+        for attr in (
+            "redshift_conn_id",
+            "aws_conn_id",
+            "s3_bucket",
+            "schema",
+            "table",
+            "method",
+            "column_list",
+            "copy_options",
+            "upsert_keys",
+            "redshift_data_api_kwargs",
+            "verify",
+            "autocommit",
+            "prefer_iam_role_default",
+            "detect_bucket_region",
+            "upsert_staging_distkey",
+            "use_connection_pool",
+            "skip_if_empty",
+        ):
+            if any(getattr(operator, attr) != getattr(first, attr) for operator in operators[1:]):
+                raise AirflowException(f"Cannot batch load operators with different '{attr}'")
+        if first.method == "EXTERNAL":
+            raise AirflowException("Cannot batch load operators using the 'EXTERNAL' method")
+
+        # Keys selected by several operators are loaded once, and a previous manifest is never loaded.
+        manifest_keys: dict[str, None] = {}
+        for operator in operators:
+            if operator.manifest_keys is not None:
+                keys = operator.manifest_keys
             else:
-                keys = self.upsert_keys or redshift_sql_hook.get_table_primary_key(self.table, self.schema)
+                keys = operator._s3_hook.list_keys(bucket_name=operator.s3_bucket, prefix=operator.s3_key)
+            manifest_keys.update((key, None) for key in keys if key != manifest_key)
+
+        if not manifest_keys:
+            if first.skip_if_empty:
+                first.log.info("No objects to load for %s operators; skipping COPY.", len(operators))
+                return
+            raise AirflowException("No objects to load for the batched operators")
+
+        # ``first`` is a copy prepared for execution, so the batch settings don't leak to the DAG's task.
+        batch = first
+        batch.s3_key = manifest_key
+        batch.manifest_keys = list(manifest_keys)
+        batch.emit_openlineage = False
+        batch.log.info(
+            "Loading %s objects from %s operators with one COPY", len(manifest_keys), len(operators)
+        )
+        batch._load()
+
+    def execute(self, context: Context) -> None:
+        self._load()
+
+    def _load(self) -> None:
+        if self.method not in AVAILABLE_METHODS:
+            raise AirflowException(f"Method not found! Available methods: {sorted(AVAILABLE_METHODS)}")
+        if self.method == "EXTERNAL":
+            self._validate_external_table()
+
+        if self.skip_if_empty and not self._has_source_objects():
+            self.log.info("No objects match s3://%s/%s; skipping COPY.", self.s3_bucket, self.s3_key)
+            return
+        if self.manifest_keys is not None and not self.manifest_keys:
+            raise AirflowException("No keys to load, 'manifest_keys' is empty")
+
+        if self.method == "EXTERNAL":
+            self._create_external_table()
+            return
+
+        keys = self.upsert_keys
+        if self.method == "UPSERT":
+            # Validate the keys before resolving credentials, which may need a call to STS.
+            keys = keys or self._get_table_primary_key()
             if not keys:
                 raise AirflowException(
                     f"No primary key on {self.schema}.{self.table}. Please provide keys on 'upsert_keys'"
                 )
-            where_statement = " AND ".join([f"{self.table}.{k} = {copy_destination}.{k}" for k in keys])
-
-            sql = [
-                f"CREATE TABLE {copy_destination} (LIKE {destination} INCLUDING DEFAULTS);",
-                copy_statement,
-                "BEGIN;",
-                f"DELETE FROM {destination} USING {copy_destination} WHERE {where_statement};",
-                f"INSERT INTO {destination} SELECT * FROM {copy_destination};",
-                "COMMIT",
-            ]
 
-        else:
-            sql = copy_statement
+        credentials_block, region_info = self._get_credentials_block_and_region()
+
+        copy_options_list = list(self.copy_options)
+        if self.manifest_keys is not None:
+            self._upload_manifest()
+            if not any(str(option).strip().upper() == "MANIFEST" for option in copy_options_list):
+                copy_options_list.append("MANIFEST")
+
+        copy_options = " ".join(copy_options_list)
+        destination = f"{self.schema}.{self.table}" if self.schema else self.table
+        copy_destination = f"#{self.table}" if self.method == "UPSERT" else destination
+
+        copy_statement = self._build_copy_query(
+            copy_destination, credentials_block, region_info, copy_options
+        )
+
+        build_sql = getattr(self, _METHOD_BUILDERS[self.method])
+        sql = build_sql(copy_statement, destination, copy_destination, keys)
+
+        # A Data API session runs one statement at a time, so don't query it alongside the load.
+        uses_data_api_session = bool(
+            {"session_id", "session_keep_alive_seconds"} & self.redshift_data_api_kwargs.keys()
+        )
+        if self.emit_openlineage and not uses_data_api_session and _is_openlineage_enabled():
+            self._prefetch_output_dataset_facets()
 
         self.log.info("Executing COPY command...")
         if self.use_redshift_data:
-            redshift_data_hook.execute_query(sql=sql, **self.redshift_data_api_kwargs)
+            self._redshift_data_hook.execute_query(sql=sql, **self.redshift_data_api_kwargs)
         else:
-            redshift_sql_hook.run(sql, autocommit=self.autocommit)
+            self._redshift_sql_hook.run(sql, autocommit=self.autocommit)
         self.log.info("COPY command complete...")
 
     def get_openlineage_facets_on_complete(self, task_instance):
         """Implement on_complete as we will query destination table."""
-        from airflow.providers.amazon.aws.utils.openlineage import (
-            get_facets_from_redshift_table,
-        )
         from airflow.providers.common.compat.openlineage.facet import (
             Dataset,
             LifecycleStateChange,
@@ -216,29 +630,45 @@ class S3ToRedshiftOperator(BaseOperator):
         )
         from airflow.providers.openlineage.extractors import OperatorLineage
 
+        if not self.emit_openlineage or not _is_openlineage_enabled():
+            return OperatorLineage()
+
         if self.use_redshift_data:
-            redshift_data_hook = RedshiftDataHook(aws_conn_id=self.redshift_conn_id)
+            redshift_data_hook = self._redshift_data_hook
             database = self.redshift_data_api_kwargs.get("database")
             identifier = self.redshift_data_api_kwargs.get(
                 "cluster_identifier", self.redshift_data_api_kwargs.get("workgroup_name")
             )
             port = self.redshift_data_api_kwargs.get("port", "5439")
             authority = f"{identifier}.{redshift_data_hook.region_name}:{port}"
-            output_dataset_facets = get_facets_from_redshift_table(
-                redshift_data_hook, self.table, self.redshift_data_api_kwargs, self.schema
-            )
         else:
-            redshift_sql_hook = RedshiftSQLHook(redshift_conn_id=self.redshift_conn_id)
+            redshift_sql_hook = self._redshift_sql_hook
             database = redshift_sql_hook.conn.schema
             authority = redshift_sql_hook.get_openlineage_database_info(redshift_sql_hook.conn).authority
-            output_dataset_facets = get_facets_from_redshift_table(
-                redshift_sql_hook, self.table, {}, self.schema
-            )
+
+        output_dataset_facets = None
+        if self.method == "EXTERNAL":
+            # Spectrum columns are not listed in information_schema.columns, which the facets query uses.
+            output_dataset_facets = {}
+        elif self._facets_thread is not None:
+            self._facets_thread.join(timeout=_FACETS_PREFETCH_TIMEOUT)
+            if self._facets_thread.is_alive():
+                # Querying again would only queue behind the pending query, so go without the schema.
+                self.log.debug("Timed out fetching OpenLineage facets for %s", self.table)
+                output_dataset_facets = {}
+            else:
+                output_dataset_facets = self._prefetched_facets
+        if output_dataset_facets is None:
+            output_dataset_facets = self._get_output_dataset_facets()
 
         if self.method == "REPLACE":
             output_dataset_facets["lifecycleStateChange"] = LifecycleStateChangeDatasetFacet(
                 lifecycleStateChange=LifecycleStateChange.OVERWRITE
             )
+        elif self.method == "EXTERNAL":
+            output_dataset_facets["lifecycleStateChange"] = LifecycleStateChangeDatasetFacet(
+                lifecycleStateChange=LifecycleStateChange.CREATE
+            )
 
         output_dataset = Dataset(
             namespace=f"redshift://{authority}",
@@ -246,9 +676,9 @@ class S3ToRedshiftOperator(BaseOperator):
             facets=output_dataset_facets,
         )
 
-        input_dataset = Dataset(
-            namespace=f"s3://{self.s3_bucket}",
-            name=self.s3_key,
-        )
+        input_datasets = [
+            Dataset(namespace=f"s3://{self.s3_bucket}", name=key)
+            for key in (self.manifest_keys if self.manifest_keys is not None else [self.s3_key])
+        ]
 
-        return OperatorLineage(inputs=[input_dataset], outputs=[output_dataset])
+        return OperatorLineage(inputs=input_datasets, outputs=[output_dataset])